@@ -13,6 +13,7 @@ from exo import __version__
 from exo.api.routes import health, ingest, query, search, commitments
 from exo.api.middleware import api_key_middleware
 from exo.api.webhooks import router as webhooks_router
+from exo.db.queries import flush_errors
 from exo.pipeline import PipelineOrchestrator
 
 
@@ -26,8 +27,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup: create orchestrator
     app.state.orchestrator = PipelineOrchestrator()
     yield
-    # Shutdown: cleanup if needed
-    pass
+    # Shutdown: write out any error rows still queued by log_error
+    await flush_errors(app.state.orchestrator.client)
 
 
 def create_app() -> FastAPI:
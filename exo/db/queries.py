@@ -5,6 +5,7 @@ Implements the data access layer using Supabase client.
 All functions take a client instance as an argument (Dependency Injection).
 """
 
+import asyncio
 from datetime import datetime
 from typing import Any
 
@@ -83,9 +84,52 @@ async def get_commitments(
     return response.data
 
 
+class _ErrorBatcher:
+    """
+    Batches error rows destined for the _errors table.
+
+    One multi-row insert per flush replaces one round-trip per error,
+    which matters on a remote Postgres link. Rows accumulate in a queue
+    and are written when max_batch is reached or flush() is called
+    explicitly (e.g. at shutdown).
+    """
+
+    def __init__(self, max_batch: int = 100) -> None:
+        self.max_batch = max_batch
+        self.queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+    async def flush(self, client: Client) -> int:
+        """
+        Drain the queue, inserting one multi-row batch per max_batch rows.
+
+        Loops until the queue is empty so a shutdown flush never strands
+        rows beyond the first batch. Returns the number of rows written.
+        """
+        written = 0
+        while True:
+            rows: list[dict[str, Any]] = []
+            while len(rows) < self.max_batch:
+                try:
+                    rows.append(self.queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            if not rows:
+                return written
+
+            client.table("_errors").insert(rows).execute()
+            written += len(rows)
+
+
+_error_batcher = _ErrorBatcher()
+
+
 async def log_error(client: Client, error_data: dict[str, Any]) -> None:
     """
-    Log an error to the _errors table.
+    Queue an error for batched insertion into the _errors table.
+
+    Rows are written with one multi-row insert once max_batch errors
+    have accumulated; use flush_errors() to force a write earlier.
     """
     # Ensure we match the schema
     payload = {
@@ -94,4 +138,16 @@ async def log_error(client: Client, error_data: dict[str, Any]) -> None:
         "details": error_data.get("details", {}),
         "source": error_data.get("source", "exo"),
     }
-    client.table("_errors").insert(payload).execute()
+    _error_batcher.queue.put_nowait(payload)
+
+    if _error_batcher.queue.qsize() >= _error_batcher.max_batch:
+        await _error_batcher.flush(client)
+
+
+async def flush_errors(client: Client) -> int:
+    """
+    Flush any queued error rows to the database.
+
+    Returns the number of rows written.
+    """
+    return await _error_batcher.flush(client)
@@ -14,12 +14,16 @@ Usage:
     is_valid, error = validate_n8n_webhook(payload, required_fields=["text"])
 """
 
+from collections.abc import Mapping
 from datetime import datetime, timezone
 from typing import Any
 
+# Sentinel distinguishing "key absent" from an explicit None value
+_MISSING = object()
+
 
 def format_n8n_response(
-    data: dict[str, Any] | list[dict[str, Any]],
+    data: dict[str, Any] | list[dict[str, Any]] | tuple[dict[str, Any], ...],
     success: bool = True,
     error: str | None = None,
     metadata: dict[str, Any] | None = None,
@@ -31,7 +35,7 @@ def format_n8n_response(
     This function ensures consistent response structure.
 
     Args:
-        data: The main response data (dict or list of dicts)
+        data: The main response data (dict, or list/tuple of dicts)
         success: Whether the operation succeeded
         error: Error message if success is False
         metadata: Additional metadata to include
@@ -58,15 +62,17 @@ def format_n8n_response(
     if error:
         response["error"] = error
 
-    # For list data, also include count
-    if isinstance(data, list):
+    # For sequence data, also include count. Exact type check instead of
+    # isinstance: no MRO walk on this hot path, and dict payloads (the
+    # common case) fail the first comparison immediately.
+    if type(data) in (list, tuple):
         response["count"] = len(data)
 
     return response
 
 
 def validate_n8n_webhook(
-    payload: dict[str, Any],
+    payload: Mapping[str, Any],
     required_fields: list[str] | None = None,
     optional_fields: list[str] | None = None,
 ) -> tuple[bool, str | None]:
@@ -92,16 +98,18 @@ def validate_n8n_webhook(
         >>> validate_n8n_webhook({}, required_fields=["text"])
         (False, "Missing required field: text")
     """
-    if not isinstance(payload, dict):
+    # Read-only access only: the payload is never copied or mutated, so
+    # callers may pass an immutable mapping (e.g. MappingProxyType).
+    if not isinstance(payload, Mapping):
         return False, "Payload must be a JSON object"
 
-    required = required_fields or []
-
-    for field in required:
-        if field not in payload:
+    # Single pass, one dict probe per field: .get with a sentinel replaces
+    # the `in` check followed by a second lookup.
+    for field in required_fields or ():
+        value = payload.get(field, _MISSING)
+        if value is _MISSING:
             return False, f"Missing required field: {field}"
 
-        value = payload[field]
         if value is None:
             return False, f"Field '{field}' cannot be null"
 
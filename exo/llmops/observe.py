@@ -48,19 +48,41 @@ P = ParamSpec("P")
 R = TypeVar("R")
 
 
-def _is_tracing_enabled() -> bool:
-    """Check if tracing is enabled via environment variable."""
+# Environment checks are cached per "generation": hot-path calls become a
+# dict lookup instead of an environ read + string parse. Call _invalidate()
+# after changing the relevant environment variables at runtime.
+_env_token = 0
+
+
+def _invalidate() -> None:
+    """Invalidate cached environment checks after os.environ changes."""
+    global _env_token
+    _env_token += 1
+
+
+@functools.lru_cache(maxsize=1)
+def _is_tracing_enabled_for(token: int) -> bool:
     env_value = os.environ.get("EXO_ENABLE_TRACING", "true").lower()
     return env_value in ("true", "1", "yes", "on")
 
 
-def _has_langfuse_credentials() -> bool:
-    """Check if Langfuse credentials are configured."""
+def _is_tracing_enabled() -> bool:
+    """Check if tracing is enabled via environment variable."""
+    return _is_tracing_enabled_for(_env_token)
+
+
+@functools.lru_cache(maxsize=1)
+def _has_langfuse_credentials_for(token: int) -> bool:
     public_key = os.environ.get("LANGFUSE_PUBLIC_KEY")
     secret_key = os.environ.get("LANGFUSE_SECRET_KEY")
     return bool(public_key and secret_key)
 
 
+def _has_langfuse_credentials() -> bool:
+    """Check if Langfuse credentials are configured."""
+    return _has_langfuse_credentials_for(_env_token)
+
+
 _langfuse_client: Langfuse | None = None
 
 
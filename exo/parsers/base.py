@@ -4,11 +4,23 @@ Abstract base class for content parsers.
 All parsers must implement the Parser interface.
 """
 
+import hashlib
 from abc import ABC, abstractmethod
 
 from exo.schemas.content import RawContent, ParsedContent
 
 
+def content_hash(text: str) -> str:
+    """
+    SHA-256 hex digest of text.
+
+    hashlib.sha256 uses OpenSSL's accelerated implementation; deliberately
+    uncached, since caching by full document text would pin whole ingested
+    documents in memory.
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
 class Parser(ABC):
     """
     Abstract base for content parsers.
@@ -20,8 +32,13 @@ class Parser(ABC):
 
     @property
     @abstractmethod
-    def supported_types(self) -> list[str]:
-        """Return list of supported source types."""
+    def supported_types(self) -> frozenset[str]:
+        """
+        Supported source types.
+
+        Concrete parsers satisfy this with a frozenset class attribute:
+        membership checks are O(1) and no list is allocated per access.
+        """
         ...
 
     @abstractmethod
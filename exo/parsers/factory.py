@@ -4,6 +4,8 @@ Parser factory.
 Returns appropriate parser based on SourceType.
 """
 
+import functools
+
 from exo.parsers.base import Parser
 from exo.parsers.transcript import TranscriptParser
 from exo.parsers.telegram import TelegramParser
@@ -21,10 +23,15 @@ _PARSERS: dict[str, Parser] = {
 }
 
 
+@functools.lru_cache(maxsize=None)
 def get_parser(source_type: str | SourceType) -> Parser:
     """
     Get parser for a given source type.
-    
+
+    Parsers are stateless singletons, so resolutions (including the
+    fallback scan for unknown types) are memoized; register_parser
+    clears the cache.
+
     Args:
         source_type: The source type (SourceType enum or string).
         
@@ -65,3 +72,5 @@ def register_parser(source_type: str | SourceType, parser: Parser) -> None:
     """
     type_str = source_type.value if isinstance(source_type, SourceType) else source_type
     _PARSERS[type_str] = parser
+    # Cached lookups may now be stale for this type
+    get_parser.cache_clear()
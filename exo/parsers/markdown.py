@@ -4,11 +4,10 @@ Parser for Markdown documents.
 Extracts structure from headers and chunks content by sections.
 """
 
-import hashlib
 import re
-from typing import Any
+from typing import Any, ClassVar
 
-from exo.parsers.base import Parser
+from exo.parsers.base import Parser, content_hash
 from exo.schemas.content import RawContent, ParsedContent, SourceType
 
 
@@ -23,10 +22,8 @@ class MarkdownParser(Parser):
     # Pattern for markdown headers
     HEADER_PATTERN = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
 
-    @property
-    def supported_types(self) -> list[str]:
-        """Return supported source types."""
-        return [SourceType.MARKDOWN, SourceType.CODE]
+    # Immutable class-level set: shared by all instances, O(1) membership
+    supported_types: ClassVar[frozenset[str]] = frozenset({SourceType.MARKDOWN, SourceType.CODE})
 
     def validate(self, content: RawContent) -> bool:
         """Validate content can be parsed as Markdown."""
@@ -81,14 +78,11 @@ class MarkdownParser(Parser):
             if preamble:
                 chunks.insert(0, preamble)
 
-        # Generate content hash
-        content_hash = hashlib.sha256(content.text.encode("utf-8")).hexdigest()
-
         return ParsedContent(
             raw=content,
             chunks=chunks,
             structure=structure,
-            content_hash=content_hash,
+            content_hash=content_hash(content.text),
         )
 
     def _build_header_tree(self, headers: list[dict]) -> list[dict]:
@@ -14,6 +14,8 @@ All models are Pydantic v2 BaseModel subclasses with:
 - Gemini structured output compatibility
 """
 
+from pydantic import TypeAdapter
+
 # Content models
 from exo.schemas.content import (
     ParsedContent,
@@ -46,6 +48,25 @@ from exo.schemas.query import (
     Source,
 )
 
+# Shared adapters for the hot models: built once at import, so callers
+# validating raw dicts (DB rows, webhook payloads) reuse one cached
+# pydantic-core validator instead of re-dispatching through the class.
+MEMORY_ADAPTER: TypeAdapter[Memory] = TypeAdapter(Memory)
+QUERY_REQUEST_ADAPTER: TypeAdapter[QueryRequest] = TypeAdapter(QueryRequest)
+
+# Batch adapters: validating a whole list crosses the Python/Rust
+# boundary once and iterates in pydantic-core, instead of a Python-level
+# loop of per-item constructions.
+ENTITY_LIST_ADAPTER: TypeAdapter[list[Entity]] = TypeAdapter(list[Entity])
+COMMITMENT_LIST_ADAPTER: TypeAdapter[list[Commitment]] = TypeAdapter(list[Commitment])
+
+# Pre-pay validator construction for the hot pipeline models at import:
+# the first ingest after startup should not stall on a lazy schema build.
+# Query models are intentionally absent — they keep their deferred build.
+for _model in (RawContent, ParsedContent, EnrichedContent, Memory, ExoError):
+    _model.model_rebuild(force=True)
+del _model
+
 __all__ = [
     # content.py
     "SourceType",
@@ -66,4 +87,9 @@ __all__ = [
     # errors.py
     "ErrorCode",
     "ExoError",
+    # shared adapters
+    "MEMORY_ADAPTER",
+    "QUERY_REQUEST_ADAPTER",
+    "ENTITY_LIST_ADAPTER",
+    "COMMITMENT_LIST_ADAPTER",
 ]
@@ -9,7 +9,7 @@ These models represent content at different stages of the pipeline:
 from datetime import datetime, timezone
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class SourceType(str, Enum):
@@ -22,6 +22,11 @@ class SourceType(str, Enum):
     CODE = "code"
 
 
+# Value -> member table: resolves the dominant string inputs with one dict
+# probe instead of pydantic's linear enum-member scan on every ingest.
+_SOURCE_TYPES = {member.value: member for member in SourceType}
+
+
 class RawContent(BaseModel):
     """
     Raw content from any input source.
@@ -44,6 +49,12 @@ class RawContent(BaseModel):
         description="Additional source-specific metadata (duration, participants, etc.)",
     )
 
+    @field_validator("source_type", mode="before")
+    @classmethod
+    def _coerce_source_type(cls, v: object) -> object:
+        """Fast-path string values to their SourceType member."""
+        return _SOURCE_TYPES.get(v, v) if isinstance(v, str) else v
+
     model_config = {
         "json_schema_extra": {
             "examples": [
@@ -80,11 +91,21 @@ class ParsedContent(BaseModel):
     )
     content_hash: str = Field(
         ...,
-        min_length=64,
-        max_length=64,
         description="SHA-256 hash for deduplication",
     )
 
+    @field_validator("content_hash")
+    @classmethod
+    def _check_content_hash(cls, v: str) -> str:
+        """Bare length/hex check; cheaper than the constrained-str path."""
+        if len(v) != 64:
+            raise ValueError("content_hash must be a 64-character SHA-256 hex digest")
+        try:
+            bytes.fromhex(v)
+        except ValueError:
+            raise ValueError("content_hash must be hexadecimal") from None
+        return v
+
     model_config = {
         "json_schema_extra": {
             "examples": [
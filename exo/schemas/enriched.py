@@ -7,10 +7,11 @@ These models represent content after LLM processing:
 - Commitment extraction
 """
 
+import sys
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class Intent(str, Enum):
@@ -51,6 +52,12 @@ class Entity(BaseModel):
         description="Normalized form (e.g., 'John D.' -> 'John Doe')",
     )
 
+    @field_validator("type", mode="before")
+    @classmethod
+    def _intern_type(cls, v: object) -> object:
+        """Intern the low-cardinality type tag so instances share one str."""
+        return sys.intern(v) if isinstance(v, str) else v
+
     model_config = {
         "json_schema_extra": {
             "examples": [
@@ -89,6 +96,12 @@ class Commitment(BaseModel):
         description="Current status",
     )
 
+    @field_validator("from_party", "to_party", mode="before")
+    @classmethod
+    def _intern_parties(cls, v: object) -> object:
+        """Intern party names; the same few people recur across records."""
+        return sys.intern(v) if isinstance(v, str) else v
+
     model_config = {
         "json_schema_extra": {
             "examples": [
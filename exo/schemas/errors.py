@@ -10,7 +10,7 @@ This enables:
 
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class ErrorCode(str, Enum):
@@ -47,6 +47,7 @@ class ExoError(BaseModel):
         case Memory() as m:
             return {"status": "ok", "id": m.id}
         case ExoError() as e:
+            # Queued for a batched insert; flushed by flush_errors()
             await log_error(client, e.model_dump())
             return {"status": "error", "code": e.code}
     ```
@@ -64,6 +65,9 @@ class ExoError(BaseModel):
     )
 
     model_config = {
+        # Errors are built internally; reject unknown keys rather than
+        # carrying them in an extra dict per instance.
+        "extra": "forbid",
         "json_schema_extra": {
             "examples": [
                 {
@@ -76,9 +80,15 @@ class ExoError(BaseModel):
         }
     }
 
+    # Lazily built string form; errors are treated as immutable values
+    # throughout the pipeline, so the cache never goes stale.
+    _str_cache: str | None = PrivateAttr(default=None)
+
     def __str__(self) -> str:
-        """Human-readable error representation."""
-        return f"[{self.code.value}] {self.message}"
+        """Human-readable error representation (built once, then cached)."""
+        if self._str_cache is None:
+            self._str_cache = f"[{self.code.value}] {self.message}"
+        return self._str_cache
 
     def __repr__(self) -> str:
         """Debug representation."""
@@ -6,14 +6,28 @@ A Memory is the final product of the ingest pipeline:
 - Ready for semantic search and RAG queries
 """
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+# orjson serializes embedding-heavy payloads several times faster than
+# pydantic's default JSON path; degrade to it when not installed.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from exo.schemas.content import SourceType
 
 
+def _utc_now() -> datetime:
+    """Default created_at factory; a named function so tests can patch it."""
+    return datetime.now(timezone.utc)
+
+
 class Memory(BaseModel):
     """
     A stored memory with embedding for semantic search.
@@ -56,6 +70,21 @@ class Memory(BaseModel):
         description="768-dim vector embedding (text-embedding-004)",
     )
 
+    @field_validator("embedding", mode="before")
+    @classmethod
+    def _coerce_embedding(cls, v: object) -> object:
+        """
+        Accept compact float buffers alongside plain lists.
+
+        Providers can hold vectors as float32 numpy arrays or
+        array('f') buffers (~4 bytes/dim instead of a boxed PyFloat
+        each) and hand them over directly; conversion to the JSON wire
+        format happens once, here.
+        """
+        if v is not None and not isinstance(v, (list, tuple)) and hasattr(v, "tolist"):
+            return v.tolist()
+        return v
+
     # Provenance
     source_type: SourceType = Field(..., description="Original source type")
     source_file: str | None = Field(
@@ -69,7 +98,7 @@ class Memory(BaseModel):
 
     # Timestamps
     created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=_utc_now,
         description="When this memory was created",
     )
     updated_at: datetime | None = Field(
@@ -77,6 +106,24 @@ class Memory(BaseModel):
         description="Last update timestamp",
     )
 
+    def to_bytes(self) -> bytes:
+        """
+        Serialize to compact JSON bytes for storage or IPC.
+
+        Uses orjson when available (native datetime/UUID handling, no
+        intermediate str), otherwise pydantic's JSON encoder.
+        """
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self.model_dump())
+        return self.model_dump_json().encode("utf-8")
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Memory":
+        """Deserialize a memory produced by to_bytes()."""
+        if ORJSON_AVAILABLE:
+            return cls.model_validate(orjson.loads(data))
+        return cls.model_validate_json(data)
+
     model_config = {
         "json_schema_extra": {
             "examples": [
@@ -99,3 +146,56 @@ class Memory(BaseModel):
             ]
         }
     }
+
+
+@dataclass(slots=True)
+class MemoryBatch:
+    """
+    Columnar (structure-of-arrays) view over a batch of memories.
+
+    Bulk scans like "who did I commit to?" touch three flat lists with
+    good locality instead of walking a nested dict per memory. The
+    Memory model itself stays unchanged; this is a read-only view built
+    on demand.
+    """
+
+    memories: list[Memory]
+    commitment_from: list[str]
+    commitment_to: list[str]
+    commitment_what: list[str]
+    commitment_memory_idx: list[int]
+
+    @classmethod
+    def from_memories(cls, memories: list[Memory]) -> "MemoryBatch":
+        """Build the columnar view in one pass over the batch."""
+        commitment_from: list[str] = []
+        commitment_to: list[str] = []
+        commitment_what: list[str] = []
+        commitment_memory_idx: list[int] = []
+
+        for idx, memory in enumerate(memories):
+            for commitment in memory.commitments:
+                commitment_from.append(commitment.get("from_party", ""))
+                commitment_to.append(commitment.get("to_party", ""))
+                commitment_what.append(commitment.get("description", ""))
+                commitment_memory_idx.append(idx)
+
+        return cls(
+            memories=memories,
+            commitment_from=commitment_from,
+            commitment_to=commitment_to,
+            commitment_what=commitment_what,
+            commitment_memory_idx=commitment_memory_idx,
+        )
+
+    def query_commitments_to(self, name: str) -> list[Memory]:
+        """Memories containing a commitment made to the given party."""
+        seen: set[int] = set()
+        results: list[Memory] = []
+        for col_idx, to_party in enumerate(self.commitment_to):
+            if to_party == name:
+                mem_idx = self.commitment_memory_idx[col_idx]
+                if mem_idx not in seen:
+                    seen.add(mem_idx)
+                    results.append(self.memories[mem_idx])
+        return results
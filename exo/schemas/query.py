@@ -39,6 +39,9 @@ class QueryRequest(BaseModel):
     )
 
     model_config = {
+        # Query models sit off the ingest hot path; build their core
+        # validators lazily so importing exo.schemas stays cheap.
+        "defer_build": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -77,6 +80,12 @@ class Source(BaseModel):
     )
 
     model_config = {
+        # Query models sit off the ingest hot path; build their core
+        # validators lazily so importing exo.schemas stays cheap.
+        "defer_build": True,
+        # Sources are built internally from search rows; reject unknown
+        # keys rather than carrying them in an extra dict per instance.
+        "extra": "forbid",
         "json_schema_extra": {
             "examples": [
                 {
@@ -118,6 +127,9 @@ class QueryResponse(BaseModel):
     )
 
     model_config = {
+        # Query models sit off the ingest hot path; build their core
+        # validators lazily so importing exo.schemas stays cheap.
+        "defer_build": True,
         "json_schema_extra": {
             "examples": [
                 {
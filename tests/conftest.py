@@ -8,6 +8,52 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from exo.ai.base import AIProvider, EmbeddingProvider
+from exo.schemas.enriched import EnrichedContent
+
+
+class FakeAIProvider(AIProvider):
+    """
+    Hand-written AI provider fake.
+
+    Plain attribute assignment instead of unittest.mock's dynamic
+    attribute machinery: each await is a direct coroutine call.
+    """
+
+    def __init__(self) -> None:
+        self.enrich_return: EnrichedContent | None = None
+        self.enrich_raises: Exception | None = None
+        self.generate_return: str = ""
+        self.enrich_calls: list[str] = []
+
+    async def enrich(self, text: str) -> EnrichedContent:
+        self.enrich_calls.append(text)
+        if self.enrich_raises is not None:
+            raise self.enrich_raises
+        assert self.enrich_return is not None, "enrich_return not configured"
+        return self.enrich_return
+
+    async def generate(self, prompt: str, context: list[str]) -> str:
+        return self.generate_return
+
+
+class FakeEmbeddingProvider(EmbeddingProvider):
+    """Hand-written embedding provider fake."""
+
+    def __init__(self) -> None:
+        self.embed_return: list[float] = []
+        self.embed_raises: Exception | None = None
+        self.embed_calls: list[str] = []
+
+    async def embed(self, text: str) -> list[float]:
+        self.embed_calls.append(text)
+        if self.embed_raises is not None:
+            raise self.embed_raises
+        return self.embed_return
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        return [await self.embed(text) for text in texts]
+
 
 @pytest.fixture(autouse=True)
 def mock_env_vars() -> Generator[None, None, None]:
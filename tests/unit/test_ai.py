@@ -144,7 +144,6 @@ class TestGeminiProviderInit:
 class TestGeminiProviderEnrich:
     """Tests for GeminiProvider.enrich() method."""
 
-    @pytest.mark.asyncio
     async def test_enrich_parses_response(self) -> None:
         """enrich() correctly parses Gemini response."""
         with patch("exo.ai.gemini.genai.configure"):
@@ -198,7 +197,6 @@ class TestGeminiProviderEnrich:
 class TestGeminiProviderGenerate:
     """Tests for GeminiProvider.generate() method."""
 
-    @pytest.mark.asyncio
     async def test_generate_returns_text(self) -> None:
         """generate() returns text response."""
         with patch("exo.ai.gemini.genai.configure"):
@@ -224,7 +222,6 @@ class TestGeminiProviderGenerate:
                     assert "contract" in result.lower()
                     assert "John" in result or "john" in result.lower()
 
-    @pytest.mark.asyncio
     async def test_generate_handles_empty_context(self) -> None:
         """generate() works with empty context."""
         with patch("exo.ai.gemini.genai.configure"):
@@ -252,7 +249,6 @@ class TestGeminiProviderGenerate:
 class TestGeminiProviderEmbed:
     """Tests for GeminiProvider.embed() methods."""
 
-    @pytest.mark.asyncio
     async def test_embed_returns_vector(self) -> None:
         """embed() returns 768-dimensional vector."""
         with patch("exo.ai.gemini.genai.configure"):
@@ -273,7 +269,6 @@ class TestGeminiProviderEmbed:
                         assert len(result) == 768
                         assert all(isinstance(v, float) for v in result)
 
-    @pytest.mark.asyncio
     async def test_embed_batch_returns_multiple_vectors(self) -> None:
         """embed_batch() returns multiple vectors."""
         with patch("exo.ai.gemini.genai.configure"):
@@ -295,7 +290,6 @@ class TestGeminiProviderEmbed:
                         for vec in result:
                             assert len(vec) == 768
 
-    @pytest.mark.asyncio
     async def test_embed_batch_empty_input(self) -> None:
         """embed_batch() handles empty input."""
         with patch("exo.ai.gemini.genai.configure"):
@@ -4,11 +4,25 @@ Unit tests for API routes.
 Tests endpoint functionality with mocked dependencies.
 """
 
+import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
+from exo.schemas.content import SourceType
+from exo.schemas.errors import ErrorCode, ExoError
+from exo.schemas.memory import Memory
+from exo.schemas.query import QueryResponse, Source
+
+# Pre-encoded request bodies: posting content= bytes skips the per-call
+# json.dumps inside the client.
+_JSON_HEADERS = {"content-type": "application/json"}
+_INGEST_BODY = json.dumps({"text": "test", "source_type": "markdown"}).encode()
+_QUERY_BODY = json.dumps({"question": "Test question?"}).encode()
+
 
 # =============================================================================
 # Test Fixtures
@@ -30,9 +44,9 @@ def mock_settings():
         yield mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_orchestrator():
-    """Create mock orchestrator."""
+    """Create mock orchestrator, shared across the module."""
     orchestrator = MagicMock()
     orchestrator.ingest = AsyncMock()
     orchestrator.query = AsyncMock()
@@ -42,20 +56,56 @@ def mock_orchestrator():
     return orchestrator
 
 
-@pytest.fixture
-def client(mock_settings, mock_orchestrator):
-    """Create test client with mocked dependencies."""
+@pytest.fixture(autouse=True)
+def _reset_orchestrator(mock_orchestrator):
+    """Clear recorded calls and per-test return values on the shared mock."""
+    yield
+    mock_orchestrator.reset_mock(return_value=True, side_effect=True)
+    mock_orchestrator._embedding_provider.embed.return_value = [0.1] * 768
+
+
+@pytest.fixture(scope="session")
+def _app():
+    """Build the FastAPI app once per session.
+
+    Route registration is the expensive part of create_app and is
+    identical for every non-auth test; only app.state.orchestrator
+    differs, and that is rebound per test by the client fixtures.
+    """
     with patch("exo.ai.gemini.genai.configure"):
         with patch("exo.ai.gemini.genai.GenerativeModel"):
             with patch("exo.db.client.create_client"):
-                # Patch the orchestrator creation in lifespan
-                with patch("exo.api.app.PipelineOrchestrator", return_value=mock_orchestrator):
-                    from exo.api.app import create_app
+                from exo.api.app import create_app
+
+                return create_app()
+
+
+@pytest.fixture
+def client(mock_settings, _app, mock_orchestrator):
+    """Create test client with mocked dependencies."""
+    # Patch the orchestrator creation in lifespan
+    with patch("exo.api.app.PipelineOrchestrator", return_value=mock_orchestrator):
+        with TestClient(_app) as test_client:
+            yield test_client
+
 
-                    app = create_app()
+@pytest.fixture
+def app(mock_settings, _app, mock_orchestrator):
+    """Bind the mock orchestrator directly to the shared app's state.
+
+    ASGITransport does not run the lifespan, so the orchestrator is
+    attached to app.state by hand instead of being created on startup.
+    """
+    _app.state.orchestrator = mock_orchestrator
+    return _app
 
-                    with TestClient(app) as test_client:
-                        yield test_client
+
+@pytest.fixture
+async def aclient(app):
+    """Async test client that talks to the app in-process, without threads."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
 
 
 # =============================================================================
@@ -97,9 +147,6 @@ class TestIngestEndpoint:
 
     def test_ingest_success(self, client: TestClient, mock_orchestrator) -> None:
         """Ingest endpoint returns memory on success."""
-        from exo.schemas.content import SourceType
-        from exo.schemas.memory import Memory
-
         # Mock successful ingest
         mock_memory = Memory(
             content="Test content",
@@ -122,8 +169,6 @@ class TestIngestEndpoint:
 
     def test_ingest_error(self, client: TestClient, mock_orchestrator) -> None:
         """Ingest endpoint returns error on failure."""
-        from exo.schemas.errors import ErrorCode, ExoError
-
         # Mock error response
         mock_orchestrator.ingest.return_value = ExoError(
             code=ErrorCode.PARSE_ERROR,
@@ -149,10 +194,8 @@ class TestIngestEndpoint:
 class TestQueryEndpoint:
     """Tests for /api/v1/query endpoint."""
 
-    def test_query_success(self, client: TestClient, mock_orchestrator) -> None:
+    async def test_query_success(self, aclient: httpx.AsyncClient, mock_orchestrator) -> None:
         """Query endpoint returns response on success."""
-        from exo.schemas.query import QueryResponse, Source
-
         # Mock successful query
         mock_response = QueryResponse(
             answer="Test answer",
@@ -165,9 +208,10 @@ class TestQueryEndpoint:
         )
         mock_orchestrator.query.return_value = mock_response
 
-        response = client.post(
+        response = await aclient.post(
             "/api/v1/query",
-            json={"question": "Test question?"},
+            content=_QUERY_BODY,
+            headers=_JSON_HEADERS,
         )
 
         assert response.status_code == 200
@@ -176,19 +220,18 @@ class TestQueryEndpoint:
         assert data["answer"] == "Test answer"
         assert len(data["sources"]) == 1
 
-    def test_query_error(self, client: TestClient, mock_orchestrator) -> None:
+    async def test_query_error(self, aclient: httpx.AsyncClient, mock_orchestrator) -> None:
         """Query endpoint returns error on failure."""
-        from exo.schemas.errors import ErrorCode, ExoError
-
         # Mock error response
         mock_orchestrator.query.return_value = ExoError(
             code=ErrorCode.AI_UNAVAILABLE,
             message="AI service unavailable",
         )
 
-        response = client.post(
+        response = await aclient.post(
             "/api/v1/query",
-            json={"question": "Test question?"},
+            content=_QUERY_BODY,
+            headers=_JSON_HEADERS,
         )
 
         assert response.status_code == 400
@@ -204,11 +247,10 @@ class TestQueryEndpoint:
 class TestWebhookEndpoints:
     """Tests for webhook endpoints."""
 
-    def test_webhook_ingest(self, client: TestClient, mock_orchestrator) -> None:
-        """Webhook ingest endpoint works with simplified payload."""
-        from exo.schemas.content import SourceType
-        from exo.schemas.memory import Memory
-
+    async def test_webhook_ingest_and_query(
+        self, aclient: httpx.AsyncClient, mock_orchestrator
+    ) -> None:
+        """Webhook endpoints work with simplified payloads."""
         mock_memory = Memory(
             content="Webhook content",
             summary="Webhook summary",
@@ -216,35 +258,31 @@ class TestWebhookEndpoints:
             source_type=SourceType.MARKDOWN,
         )
         mock_orchestrator.ingest.return_value = mock_memory
-
-        response = client.post(
-            "/webhook/ingest",
-            json={"text": "Webhook content", "source_type": "markdown"},
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True
-        assert data["summary"] == "Webhook summary"
-
-    def test_webhook_query(self, client: TestClient, mock_orchestrator) -> None:
-        """Webhook query endpoint works with simplified payload."""
-        from exo.schemas.query import QueryResponse
-
-        mock_response = QueryResponse(
+        mock_orchestrator.query.return_value = QueryResponse(
             answer="Webhook answer",
             sources=[],
             confidence=0.8,
         )
-        mock_orchestrator.query.return_value = mock_response
 
-        response = client.post(
-            "/webhook/query",
-            json={"question": "Webhook question?"},
+        # The two cases are independent, so issue them concurrently
+        ingest_response, query_response = await asyncio.gather(
+            aclient.post(
+                "/webhook/ingest",
+                json={"text": "Webhook content", "source_type": "markdown"},
+            ),
+            aclient.post(
+                "/webhook/query",
+                json={"question": "Webhook question?"},
+            ),
         )
 
-        assert response.status_code == 200
-        data = response.json()
+        assert ingest_response.status_code == 200
+        data = ingest_response.json()
+        assert data["success"] is True
+        assert data["summary"] == "Webhook summary"
+
+        assert query_response.status_code == 200
+        data = query_response.json()
         assert data["success"] is True
         assert data["answer"] == "Webhook answer"
 
@@ -278,23 +316,24 @@ class TestMiddleware:
                             # Request without key should fail
                             response = test_client.post(
                                 "/api/v1/ingest",
-                                json={"text": "test", "source_type": "markdown"},
+                                content=_INGEST_BODY,
+                                headers=_JSON_HEADERS,
                             )
                             assert response.status_code == 401
 
                             # Request with wrong key should fail
                             response = test_client.post(
                                 "/api/v1/ingest",
-                                json={"text": "test", "source_type": "markdown"},
-                                headers={"X-API-Key": "wrong-key"},
+                                content=_INGEST_BODY,
+                                headers={**_JSON_HEADERS, "X-API-Key": "wrong-key"},
                             )
                             assert response.status_code == 401
 
                             # Request with correct key should work
                             response = test_client.post(
                                 "/api/v1/ingest",
-                                json={"text": "test", "source_type": "markdown"},
-                                headers={"X-API-Key": "secret-key"},
+                                content=_INGEST_BODY,
+                                headers={**_JSON_HEADERS, "X-API-Key": "secret-key"},
                             )
                             # Will fail because orchestrator is mocked, but auth passes
                             assert response.status_code != 401
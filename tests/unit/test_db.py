@@ -5,11 +5,11 @@ Tests query functions using mocked Supabase client.
 """
 
 from datetime import datetime, timezone
-from unittest.mock import MagicMock
-
-import pytest
+from unittest.mock import MagicMock, call
 
 from exo.db.queries import (
+    _error_batcher,
+    flush_errors,
     get_commitments,
     insert_memory,
     log_error,
@@ -17,8 +17,23 @@ from exo.db.queries import (
 )
 from exo.schemas.memory import Memory, SourceType
 
+# Shared 768-dim embedding; passing the same object to the call and the
+# expected args lets assert_called_with short-circuit on identity instead
+# of comparing 768 floats.
+_EMBEDDING = [0.1] * 768
+
+# Expected RPC call for test_search_semantic, built once at import.
+_EXPECTED_RPC_CALL = call(
+    "match_memories",
+    {
+        "query_embedding": _EMBEDDING,
+        "match_threshold": 0.8,
+        "match_count": 5,
+        "filter_source_type": "audio",
+    },
+)
+
 
-@pytest.mark.asyncio
 async def test_insert_memory(mock_supabase_client: MagicMock) -> None:
     """Test inserting a memory record."""
     memory = Memory(
@@ -44,11 +59,8 @@ async def test_insert_memory(mock_supabase_client: MagicMock) -> None:
     mock_supabase_client.table.return_value.upsert.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_search_semantic(mock_supabase_client: MagicMock) -> None:
     """Test semantic search RPC call."""
-    embedding = [0.1] * 768
-    
     # Setup mock response
     mock_response = MagicMock()
     mock_response.data = [
@@ -59,7 +71,7 @@ async def test_search_semantic(mock_supabase_client: MagicMock) -> None:
     # Execute
     results = await search_semantic(
         mock_supabase_client,
-        embedding,
+        _EMBEDDING,
         match_threshold=0.8,
         match_count=5,
         filter_source_type="audio",
@@ -68,18 +80,9 @@ async def test_search_semantic(mock_supabase_client: MagicMock) -> None:
     # Verify
     assert len(results) == 1
     assert results[0]["content"] == "match"
-    mock_supabase_client.rpc.assert_called_with(
-        "match_memories",
-        {
-            "query_embedding": embedding,
-            "match_threshold": 0.8,
-            "match_count": 5,
-            "filter_source_type": "audio",
-        },
-    )
+    mock_supabase_client.rpc.assert_has_calls([_EXPECTED_RPC_CALL])
 
 
-@pytest.mark.asyncio
 async def test_get_commitments(mock_supabase_client: MagicMock) -> None:
     """Test fetching commitments with filters."""
     # Setup mock response
@@ -112,9 +115,8 @@ async def test_get_commitments(mock_supabase_client: MagicMock) -> None:
     query_mock.lte.assert_called()
 
 
-@pytest.mark.asyncio
 async def test_log_error(mock_supabase_client: MagicMock) -> None:
-    """Test error logging."""
+    """Test error logging enqueues a normalized row without inserting."""
     error_data = {
         "code": "TEST_ERROR",
         "message": "Something went wrong",
@@ -124,11 +126,43 @@ async def test_log_error(mock_supabase_client: MagicMock) -> None:
     # Execute
     await log_error(mock_supabase_client, error_data)
 
-    # Verify
-    mock_supabase_client.table.assert_called_with("_errors")
-    mock_supabase_client.table.return_value.insert.assert_called_with({
+    # Verify: below max_batch nothing is written, the row is queued
+    mock_supabase_client.table.return_value.insert.assert_not_called()
+    assert _error_batcher.queue.get_nowait() == {
         "error_code": "TEST_ERROR",
         "message": "Something went wrong",
         "details": {"foo": "bar"},
         "source": "exo",
-    })
+    }
+
+
+async def test_flush_errors(mock_supabase_client: MagicMock) -> None:
+    """Test queued errors are written with a single batch insert."""
+    await log_error(mock_supabase_client, {"code": "ERR_1", "message": "first"})
+    await log_error(mock_supabase_client, {"code": "ERR_2", "message": "second"})
+
+    # Execute
+    written = await flush_errors(mock_supabase_client)
+
+    # Verify: one insert call carrying both rows
+    assert written == 2
+    mock_supabase_client.table.assert_called_with("_errors")
+    mock_supabase_client.table.return_value.insert.assert_called_once()
+    rows = mock_supabase_client.table.return_value.insert.call_args[0][0]
+    assert [r["error_code"] for r in rows] == ["ERR_1", "ERR_2"]
+
+
+async def test_flush_errors_drains_past_max_batch(
+    mock_supabase_client: MagicMock,
+) -> None:
+    """Test a flush empties the whole queue, one insert per batch."""
+    for i in range(_error_batcher.max_batch + 5):
+        _error_batcher.queue.put_nowait({"error_code": f"ERR_{i}", "message": "m"})
+
+    # Execute
+    written = await flush_errors(mock_supabase_client)
+
+    # Verify: nothing stranded; two batch inserts (full batch + remainder)
+    assert written == _error_batcher.max_batch + 5
+    assert _error_batcher.queue.empty()
+    assert mock_supabase_client.table.return_value.insert.call_count == 2
@@ -48,41 +48,36 @@ class TestEvaluationResult:
 class TestRAGEvaluationResult:
     """Tests for RAGEvaluationResult dataclass."""
 
-    def test_all_passed_when_all_pass(self) -> None:
-        """all_passed is True when all metrics pass."""
+    @pytest.mark.parametrize(
+        ("scores", "passed", "expected_all_passed", "expected_avg"),
+        [
+            ((0.9, 0.85, 0.8), (True, True, True), True, 0.85),
+            ((0.9, 0.5, 0.8), (True, False, True), False, 2.2 / 3),
+            ((0.9, 0.8, 0.7), (True, True, True), True, 0.8),
+        ],
+    )
+    def test_all_passed_and_average_score(
+        self,
+        scores: tuple[float, float, float],
+        passed: tuple[bool, bool, bool],
+        expected_all_passed: bool,
+        expected_avg: float,
+    ) -> None:
+        """all_passed and average_score reflect the per-metric results."""
         result = RAGEvaluationResult(
-            answer_relevancy=EvaluationResult("ar", 0.9, True),
-            faithfulness=EvaluationResult("f", 0.85, True),
-            contextual_relevancy=EvaluationResult("cr", 0.8, True),
+            answer_relevancy=EvaluationResult("ar", scores[0], passed[0]),
+            faithfulness=EvaluationResult("f", scores[1], passed[1]),
+            contextual_relevancy=EvaluationResult("cr", scores[2], passed[2]),
         )
-        
-        assert result.all_passed is True
 
-    def test_all_passed_when_one_fails(self) -> None:
-        """all_passed is False when any metric fails."""
-        result = RAGEvaluationResult(
-            answer_relevancy=EvaluationResult("ar", 0.9, True),
-            faithfulness=EvaluationResult("f", 0.5, False),
-            contextual_relevancy=EvaluationResult("cr", 0.8, True),
-        )
-        
-        assert result.all_passed is False
+        assert result.all_passed is expected_all_passed
+        assert result.average_score == pytest.approx(expected_avg, abs=1e-9)
 
     def test_all_passed_when_skipped(self) -> None:
         """all_passed is True when evaluation is skipped."""
         result = RAGEvaluationResult(skipped=True, skip_reason="No deepeval")
-        
-        assert result.all_passed is True
 
-    def test_average_score(self) -> None:
-        """Calculates average score correctly."""
-        result = RAGEvaluationResult(
-            answer_relevancy=EvaluationResult("ar", 0.9, True),
-            faithfulness=EvaluationResult("f", 0.8, True),
-            contextual_relevancy=EvaluationResult("cr", 0.7, True),
-        )
-        
-        assert result.average_score == pytest.approx(0.8, rel=0.01)
+        assert result.all_passed is True
 
     def test_average_score_when_skipped(self) -> None:
         """Average score is 0 when skipped."""
@@ -101,6 +96,20 @@ class TestRAGEvaluationResult:
         assert "answer_relevancy" in d
 
 
+def _skip_result(metric_name: str) -> EvaluationResult:
+    """Expected result when a metric is skipped (DeepEval absent)."""
+    return EvaluationResult(
+        metric_name=metric_name,
+        score=0.0,
+        passed=True,
+        reason="DeepEval not installed - skipped",
+    )
+
+
+# Collection-time gate: when DeepEval is installed the evaluate_* calls
+# would import its heavy modules (or hit a live model); the real-metric
+# behavior is covered by tests/rag instead.
+@pytest.mark.skipif(DEEPEVAL_AVAILABLE, reason="covered by tests/rag when DeepEval is installed")
 class TestGracefulSkip:
     """Tests for graceful skip when DeepEval not installed."""
 
@@ -110,14 +119,10 @@ class TestGracefulSkip:
             query="What is the capital of France?",
             answer="Paris",
         )
-        
-        # Should return a result either way
-        assert isinstance(result, EvaluationResult)
-        assert result.metric_name == "answer_relevancy"
-        
-        if not DEEPEVAL_AVAILABLE:
-            assert result.passed is True  # Passes when skipped
-            assert "not installed" in (result.reason or "").lower() or "skipped" in (result.reason or "").lower()
+
+        # Skip results are deterministic: one dataclass equality covers
+        # every field.
+        assert result == _skip_result("answer_relevancy")
 
     def test_evaluate_faithfulness_graceful_skip(self) -> None:
         """Faithfulness evaluation gracefully skips."""
@@ -126,12 +131,8 @@ class TestGracefulSkip:
             answer="Paris is the capital.",
             context=["Paris is the capital of France."],
         )
-        
-        assert isinstance(result, EvaluationResult)
-        assert result.metric_name == "faithfulness"
-        
-        if not DEEPEVAL_AVAILABLE:
-            assert result.passed is True
+
+        assert result == _skip_result("faithfulness")
 
     def test_evaluate_contextual_relevancy_graceful_skip(self) -> None:
         """Contextual relevancy evaluation gracefully skips."""
@@ -139,12 +140,8 @@ class TestGracefulSkip:
             query="What is the capital of France?",
             context=["Paris is the capital of France."],
         )
-        
-        assert isinstance(result, EvaluationResult)
-        assert result.metric_name == "contextual_relevancy"
-        
-        if not DEEPEVAL_AVAILABLE:
-            assert result.passed is True
+
+        assert result == _skip_result("contextual_relevancy")
 
     def test_run_rag_evaluation_graceful_skip(self) -> None:
         """Full RAG evaluation gracefully skips."""
@@ -153,10 +150,9 @@ class TestGracefulSkip:
             answer="Paris",
             context=["France is a country. Paris is its capital."],
         )
-        
-        assert isinstance(result, RAGEvaluationResult)
-        
-        if not DEEPEVAL_AVAILABLE:
-            assert result.skipped is True
-            assert result.skip_reason == "DeepEval not installed"
-            assert result.all_passed is True  # Skipped counts as passed
+
+        assert result == RAGEvaluationResult(
+            skipped=True,
+            skip_reason="DeepEval not installed",
+        )
+        assert result.all_passed is True  # Skipped counts as passed
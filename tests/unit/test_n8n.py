@@ -2,6 +2,8 @@
 Unit tests for n8n integration helpers.
 """
 
+from types import MappingProxyType
+
 import pytest
 
 from exo.integrations.n8n import (
@@ -36,7 +38,7 @@ class TestFormatN8nResponse:
 
     def test_format_list_response(self) -> None:
         """Includes count for list data."""
-        data = [{"id": 1}, {"id": 2}, {"id": 3}]
+        data = ({"id": 1}, {"id": 2}, {"id": 3})
         result = format_n8n_response(data, success=True)
 
         assert result["count"] == 3
@@ -56,7 +58,7 @@ class TestValidateN8nWebhook:
 
     def test_valid_payload(self) -> None:
         """Validates correct payload."""
-        payload = {"text": "Hello", "source_type": "markdown"}
+        payload = MappingProxyType({"text": "Hello", "source_type": "markdown"})
         is_valid, error = validate_n8n_webhook(payload, required_fields=["text"])
 
         assert is_valid is True
@@ -64,7 +66,7 @@ class TestValidateN8nWebhook:
 
     def test_missing_required_field(self) -> None:
         """Rejects payload missing required field."""
-        payload = {"source_type": "markdown"}
+        payload = MappingProxyType({"source_type": "markdown"})
         is_valid, error = validate_n8n_webhook(payload, required_fields=["text"])
 
         assert is_valid is False
@@ -72,7 +74,7 @@ class TestValidateN8nWebhook:
 
     def test_empty_required_field(self) -> None:
         """Rejects payload with empty required field."""
-        payload = {"text": "", "source_type": "markdown"}
+        payload = MappingProxyType({"text": "", "source_type": "markdown"})
         is_valid, error = validate_n8n_webhook(payload, required_fields=["text"])
 
         assert is_valid is False
@@ -80,7 +82,7 @@ class TestValidateN8nWebhook:
 
     def test_null_required_field(self) -> None:
         """Rejects payload with null required field."""
-        payload = {"text": None}
+        payload = MappingProxyType({"text": None})
         is_valid, error = validate_n8n_webhook(payload, required_fields=["text"])
 
         assert is_valid is False
@@ -95,7 +97,7 @@ class TestValidateN8nWebhook:
 
     def test_no_required_fields(self) -> None:
         """Accepts any payload when no required fields."""
-        payload = {"anything": "goes"}
+        payload = MappingProxyType({"anything": "goes"})
         is_valid, error = validate_n8n_webhook(payload)
 
         assert is_valid is True
